@@ -1,6 +1,7 @@
 from psd_tools import PSDImage
 from PIL import Image
 import os
+from resize import DEFAULT_QUALITY, apply_draft, fast_resize
 
 class ImageProcessor:
     def __init__(self):
@@ -107,13 +108,14 @@ class ImageProcessor:
                 scale = min(max_width / width, max_height / height)
                 new_size = (int(width * scale), int(height * scale))
                 
-                # 调整产品图大小
-                product_img = img.resize(new_size, Image.LANCZOS)
+                # 调整产品图大小（JPEG 先用 draft 缩小解码，再分步缩放）
+                img = apply_draft(img, new_size, config.resize_quality)
+                product_img = fast_resize(img, new_size, config.resize_quality)
                 if product_img.mode != 'RGBA':
                     product_img = product_img.convert('RGBA')
                 
                 # 调整模板大小
-                template = template.resize(canvas_size, Image.LANCZOS)
+                template = fast_resize(template, canvas_size, config.resize_quality)
                 if template.mode != 'RGBA':
                     template = template.convert('RGBA')
                 
@@ -193,6 +195,9 @@ class ImageProcessor:
             raise ValueError("无效的模板文件")
             
         try:
+            # 加载配置
+            config = TemplateConfig()
+            
             # 打开图片和模板
             with Image.open(image_path) as img, Image.open(template_path) as template:
                 # 创建一个透明背景的正方形画布
@@ -204,13 +209,14 @@ class ImageProcessor:
                 scale = product_size / max(img.size)
                 new_size = tuple(int(dim * scale) for dim in img.size)
                 
-                # 调整产品图大小并确保是RGBA模式
-                img = img.resize(new_size, Image.LANCZOS)
+                # 调整产品图大小并确保是RGBA模式（JPEG 先用 draft 缩小解码）
+                img = apply_draft(img, new_size, config.resize_quality)
+                img = fast_resize(img, new_size, config.resize_quality)
                 if img.mode != 'RGBA':
                     img = img.convert('RGBA')
                 
                 # 调整模板大小并确保是RGBA模式
-                template = template.resize((size, size), Image.LANCZOS)
+                template = fast_resize(template, (size, size), config.resize_quality)
                 if template.mode != 'RGBA':
                     template = template.convert('RGBA')
                 
@@ -254,6 +260,9 @@ class TemplateConfig:
         
         # 安全边距（像素）
         self.margin = 20
+        
+        # 缩放质量档位：'fast' / 'balanced' / 'best'（见 resize.RESIZE_PROFILES）
+        self.resize_quality = DEFAULT_QUALITY
 
 def main():
     processor = ImageProcessor()
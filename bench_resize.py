@@ -0,0 +1,101 @@
+"""缩放性能对比：各质量档位与原有完整 LANCZOS 路径的耗时和 PSNR
+
+用法: python bench_resize.py [图片路径] [目标边长]
+不传图片路径时生成一张 6000x6000 的测试图（约 20 倍缩小到 300）。
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from resize import RESIZE_PROFILES, apply_draft, fast_resize
+
+
+def make_test_image(path, size=6000):
+    """生成带渐变和细节纹理的 JPEG 测试图"""
+    x = np.linspace(0, 255, size, dtype=np.float32)
+    xx, yy = np.meshgrid(x, x)
+    noise = np.random.default_rng(0).integers(0, 40, (size, size), dtype=np.uint8)
+    data = np.stack([
+        xx,
+        yy,
+        (np.sin(xx / 7) * 60 + 128) + noise,
+    ], axis=-1).clip(0, 255).astype(np.uint8)
+    Image.fromarray(data, 'RGB').save(path, 'JPEG', quality=90)
+
+
+def psnr(a, b):
+    """计算两张同尺寸图片的 PSNR（dB）"""
+    a = np.asarray(a.convert('RGB'), dtype=np.float64)
+    b = np.asarray(b.convert('RGB'), dtype=np.float64)
+    mse = np.mean((a - b) ** 2)
+    if mse == 0:
+        return float('inf')
+    return 10 * np.log10(255.0 ** 2 / mse)
+
+
+def target_size(img_size, max_side):
+    scale = max_side / max(img_size)
+    return tuple(int(dim * scale) for dim in img_size)
+
+
+def run_baseline(path, max_side):
+    """原有路径：完整解码后直接做一次 LANCZOS"""
+    with Image.open(path) as img:
+        size = target_size(img.size, max_side)
+        return img.resize(size, Image.LANCZOS)
+
+
+def run_profile(path, max_side, quality):
+    with Image.open(path) as img:
+        size = target_size(img.size, max_side)
+        img = apply_draft(img, size, quality)
+        return fast_resize(img, size, quality)
+
+
+def timed(func, *args, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    max_side = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    temp_dir = None
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        temp_dir = tempfile.mkdtemp()
+        path = os.path.join(temp_dir, 'bench.jpg')
+        print("生成测试图片...")
+        make_test_image(path)
+
+    try:
+        with Image.open(path) as img:
+            print(f"源图: {path} {img.size} {img.format}, 目标边长: {max_side}")
+
+        base_time, reference = timed(run_baseline, path, max_side)
+        print(f"\n{'路径':<12}{'耗时(ms)':>12}{'加速':>10}{'PSNR(dB)':>12}")
+        print(f"{'原有LANCZOS':<12}{base_time * 1000:>12.1f}{1.0:>10.2f}{'-':>12}")
+
+        for quality in RESIZE_PROFILES:
+            elapsed, result = timed(run_profile, path, max_side, quality)
+            value = psnr(reference, result)
+            print(f"{quality:<12}{elapsed * 1000:>12.1f}"
+                  f"{base_time / elapsed:>10.2f}{value:>12.2f}")
+    finally:
+        if temp_dir:
+            os.remove(path)
+            os.rmdir(temp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import os
 from psd_tools import PSDImage
 import numpy as np
 from PIL import ImageStat
+from resize import DEFAULT_QUALITY, fast_resize
 
 class TemplateAnalyzer:
     def __init__(self, template_image):
@@ -69,7 +70,7 @@ def remove_white_background(image):
     
     return Image.fromarray(data)
 
-def process_image(psd_path, template_path, output_path):
+def process_image(psd_path, template_path, output_path, resize_quality=DEFAULT_QUALITY):
     try:
         # 打开PSD文件并转换为PIL Image
         psd = PSDImage.open(psd_path)
@@ -109,7 +110,7 @@ def process_image(psd_path, template_path, output_path):
             new_height = int(new_width / product_ratio)
         
         # 调整产品图片大小
-        product_img = product_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        product_img = fast_resize(product_img, (new_width, new_height), resize_quality)
         
         # 计算居中位置
         pos_x = (canvas_size[0] - new_width) // 2
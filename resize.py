@@ -0,0 +1,51 @@
+from PIL import Image
+
+# 缩放质量档位：
+#   reducing_gap - 先用整数倍 reduce（盒式平均）缩到目标尺寸的 N 倍以内，再做 LANCZOS；
+#                  值越小越快，None 表示直接从原图做完整 LANCZOS（原有行为）
+#   draft        - JPEG 是否使用 draft 模式在解码阶段按 1/2、1/4、1/8 缩小
+RESIZE_PROFILES = {
+    'fast': {'reducing_gap': 2.0, 'draft': True},
+    'balanced': {'reducing_gap': 3.0, 'draft': True},
+    'best': {'reducing_gap': None, 'draft': False},
+}
+
+DEFAULT_QUALITY = 'balanced'
+
+
+def get_profile(quality):
+    """获取缩放质量档位配置"""
+    if quality not in RESIZE_PROFILES:
+        raise ValueError(f"未知的缩放质量: {quality}（可选: {', '.join(RESIZE_PROFILES)}）")
+    return RESIZE_PROFILES[quality]
+
+
+def apply_draft(img, target_size, quality=DEFAULT_QUALITY):
+    """JPEG 在解码前启用 draft 模式，直接按比例解码出较小的图片
+
+    必须在图片数据加载（load/resize/convert 等）之前调用。
+    draft 只会缩到不小于请求尺寸的最小比例，这里请求目标尺寸的
+    reducing_gap 倍，为最后一步 LANCZOS 保留足够的像素。
+    """
+    profile = get_profile(quality)
+    if not profile['draft'] or img.format != 'JPEG':
+        return img
+
+    gap = profile['reducing_gap'] or 1.0
+    request_size = (int(target_size[0] * gap), int(target_size[1] * gap))
+    if request_size[0] >= img.width or request_size[1] >= img.height:
+        return img
+
+    img.draft(img.mode, request_size)
+    return img
+
+
+def fast_resize(img, size, quality=DEFAULT_QUALITY):
+    """分步缩放：先整数倍 reduce，再做最终的 LANCZOS
+
+    大比例缩小（例如 20 倍）时，直接从原始分辨率做 LANCZOS 开销很大；
+    借助 Pillow 的 reducing_gap 先做廉价的盒式缩小，结果与完整 LANCZOS
+    几乎无差别。放大或缩小比例不足 reducing_gap 时等同于普通 resize。
+    """
+    profile = get_profile(quality)
+    return img.resize(size, Image.LANCZOS, reducing_gap=profile['reducing_gap'])